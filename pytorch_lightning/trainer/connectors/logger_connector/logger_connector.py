@@ -35,6 +35,8 @@ class LoggerConnector:
         self.eval_loop_results = []
         self._val_log_step: int = 0
         self._test_log_step: int = 0
+        # the eval log step whose metrics were not sent to the loggers yet
+        self._pending_eval_log_step: Optional[int] = None
         self._progress_bar_metrics: Dict[str, float] = {}
         self._logged_metrics: Dict[str, _METRIC] = {}
         self._callback_metrics: Dict[str, _METRIC] = {}
@@ -143,19 +145,38 @@ class LoggerConnector:
         self.trainer._results.extract_batch_size(batch)
         self._batch_idx = batch_idx
 
-    def update_eval_step_metrics(self) -> None:
+    def _should_update_eval_logs(self, is_last_batch: bool) -> bool:
+        step = self._eval_log_step
+        if step is None or is_last_batch:
+            return True
+        return (step + 1) % self.trainer.log_every_n_steps == 0
+
+    def update_eval_step_metrics(self, is_last_batch: bool = False) -> None:
         if self.trainer.sanity_checking:
             return
 
-        # logs user requested information to logger
+        # logs user requested information to logger every `log_every_n_steps` and on the last batch
         assert not self._epoch_end_reached
-        metrics = self.metrics[MetricSource.LOG]
-        if metrics:
-            self.log_metrics(metrics, step=self._eval_log_step)
+        if self._should_update_eval_logs(is_last_batch):
+            self._log_eval_step_metrics(self._eval_log_step)
+        else:
+            self._pending_eval_log_step = self._eval_log_step
 
         # increment the step even if nothing was logged
         self._increment_eval_log_step()
 
+    def flush_eval_step_metrics(self) -> None:
+        """Logs the metrics of the last evaluation step if they were held back by ``log_every_n_steps``."""
+        if self.trainer.sanity_checking or self._pending_eval_log_step is None:
+            return
+        self._log_eval_step_metrics(self._pending_eval_log_step)
+
+    def _log_eval_step_metrics(self, step: Optional[int]) -> None:
+        self._pending_eval_log_step = None
+        metrics = self.metrics[MetricSource.LOG]
+        if metrics:
+            self.log_metrics(metrics, step=step)
+
     def _prepare_eval_loop_results(self, metrics: Mapping[str, _METRIC]) -> None:
         if self.trainer.sanity_checking:
             return
@@ -239,6 +260,7 @@ class LoggerConnector:
 
     def on_epoch_start(self) -> None:
         self._epoch_end_reached = False
+        self._pending_eval_log_step = None
 
     def on_batch_start(self) -> None:
         self._epoch_end_reached = False
@@ -11,8 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import OrderedDict
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from torch.utils.data import DataLoader
 
@@ -34,6 +33,15 @@ class EvaluationLoop(object):
         self.max_batches: Optional[List[Union[int, float]]] = None
         self.warning_cache = WarningCache()
         self.num_dataloaders: Optional[int] = None
+        self._pass_dataloader_idx: bool = False
+        self._is_test: bool = False
+        self._step_name: str = 'validation_step'
+        self._step_end_name: str = 'validation_step_end'
+        self._batch_start_hook: str = 'on_validation_batch_start'
+        self._batch_end_hook: str = 'on_validation_batch_end'
+        self._step_fn: Optional[Callable[[Dict[str, Union[Any, int]]], Optional[STEP_OUTPUT]]] = None
+        self._call_batch_start_hook: bool = True
+        self._call_batch_end_hook: bool = True
         self._val_results = ResultCollection(training=False)
         self._test_results = ResultCollection(training=False)
 
@@ -141,6 +149,21 @@ class EvaluationLoop(object):
 
         self.max_batches = max_batches
         self.num_dataloaders = self._get_num_dataloaders(dataloaders)
+        # only pass `dataloader_idx` to the step when there are multiple dataloaders
+        self._pass_dataloader_idx = self.num_dataloaders > 1
+
+        # resolve the stage specific step and hook names once instead of on every batch
+        self._is_test = self.trainer.testing
+        stage = 'test' if self._is_test else 'validation'
+        self._step_name = f'{stage}_step'
+        self._step_end_name = f'{stage}_step_end'
+        self._batch_start_hook = f'on_{stage}_batch_start'
+        self._batch_end_hook = f'on_{stage}_batch_end'
+        accelerator = self.trainer.accelerator
+        self._step_fn = accelerator.test_step if self._is_test else accelerator.validation_step
+        # skip dispatching the batch hooks when nothing implements them
+        self._call_batch_start_hook = self.trainer._is_hook_implemented(self._batch_start_hook)
+        self._call_batch_end_hook = self.trainer._is_hook_implemented(self._batch_end_hook)
 
     def on_evaluation_epoch_start(self, *args: Any, **kwargs: Any) -> None:
         self.trainer.logger_connector.on_epoch_start()
@@ -153,14 +176,9 @@ class EvaluationLoop(object):
 
     def _build_kwargs(self, batch: Any, batch_idx: int, dataloader_idx: int) -> Dict[str, Union[Any, int]]:
         # make dataloader_idx arg in validation_step optional
-        step_kwargs = OrderedDict([('batch', batch), ('batch_idx', batch_idx)])
+        step_kwargs = {'batch': batch, 'batch_idx': batch_idx}
 
-        multiple_val_loaders = (
-            not self.trainer.testing and self._get_num_dataloaders(self.trainer.val_dataloaders) > 1
-        )
-        multiple_test_loaders = (self.trainer.testing and self._get_num_dataloaders(self.trainer.test_dataloaders) > 1)
-
-        if multiple_test_loaders or multiple_val_loaders:
+        if self._pass_dataloader_idx:
             step_kwargs['dataloader_idx'] = dataloader_idx
 
         return step_kwargs
@@ -180,23 +198,15 @@ class EvaluationLoop(object):
         # configure step_kwargs
         step_kwargs = self._build_kwargs(batch, batch_idx, dataloader_idx)
 
-        if self.trainer.testing:
-            self.trainer.lightning_module._current_fx_name = "test_step"
-            with self.trainer.profiler.profile("test_step"):
-                output = self.trainer.accelerator.test_step(step_kwargs)
-        else:
-            self.trainer.lightning_module._current_fx_name = "validation_step"
-            with self.trainer.profiler.profile("validation_step"):
-                output = self.trainer.accelerator.validation_step(step_kwargs)
+        assert self._step_fn is not None
+        self.trainer.lightning_module._current_fx_name = self._step_name
+        with self.trainer.profiler.profile(self._step_name):
+            output = self._step_fn(step_kwargs)
 
         return output
 
-    def evaluation_step_end(self, *args: Any, **kwargs: Any) -> Optional[STEP_OUTPUT]:
-        if self.trainer.testing:
-            output = self.trainer.call_hook('test_step_end', *args, **kwargs)
-        else:
-            output = self.trainer.call_hook('validation_step_end', *args, **kwargs)
-        return output
+    def evaluation_step_end(self, output: Optional[STEP_OUTPUT]) -> Optional[STEP_OUTPUT]:
+        return self.trainer.call_hook(self._step_end_name, output)
 
     def _should_track_batch_outputs_for_epoch_end(self) -> bool:
         model = self.trainer.lightning_module
@@ -226,16 +236,15 @@ class EvaluationLoop(object):
                 model.validation_epoch_end(outputs)
 
     def on_evaluation_batch_start(self, batch: Any, batch_idx: int, dataloader_idx: int) -> None:
-        self.trainer.logger_connector.on_batch_start()
+        logger_connector = self.trainer.logger_connector
+        logger_connector.on_batch_start()
 
         # set dataloader_idx to model and track batch_size
         assert self.num_dataloaders is not None
-        self.trainer.logger_connector.on_evaluation_batch_start(batch, batch_idx, dataloader_idx, self.num_dataloaders)
+        logger_connector.on_evaluation_batch_start(batch, batch_idx, dataloader_idx, self.num_dataloaders)
 
-        if self.trainer.testing:
-            self.trainer.call_hook('on_test_batch_start', batch, batch_idx, dataloader_idx)
-        else:
-            self.trainer.call_hook('on_validation_batch_start', batch, batch_idx, dataloader_idx)
+        if self._call_batch_start_hook:
+            self.trainer.call_hook(self._batch_start_hook, batch, batch_idx, dataloader_idx)
 
     def on_evaluation_batch_end(
         self,
@@ -244,10 +253,8 @@ class EvaluationLoop(object):
         batch_idx: int,
         dataloader_idx: int,
     ) -> None:
-        if self.trainer.testing:
-            self.trainer.call_hook('on_test_batch_end', output, batch, batch_idx, dataloader_idx)
-        else:
-            self.trainer.call_hook('on_validation_batch_end', output, batch, batch_idx, dataloader_idx)
+        if self._call_batch_end_hook:
+            self.trainer.call_hook(self._batch_end_hook, output, batch, batch_idx, dataloader_idx)
 
         self.trainer.logger_connector.on_batch_end()
 
@@ -255,9 +262,9 @@ class EvaluationLoop(object):
         self.store_predictions(output, batch_idx, dataloader_idx)
 
     def store_predictions(self, output: Optional[STEP_OUTPUT], batch_idx: int, dataloader_idx: int) -> None:
-        # Add step predictions to prediction collection to write later
-        if output is not None and self.predictions is not None:
-            if isinstance(output, ResultCollection) and self.trainer.testing:
+        # Add step predictions to prediction collection to write later, only done when testing
+        if self._is_test and output is not None and self.predictions is not None:
+            if isinstance(output, ResultCollection):
                 self.predictions.add(output.pop('predictions', None))
 
         # track debug metrics
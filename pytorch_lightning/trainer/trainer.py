@@ -15,7 +15,7 @@
 import logging
 import warnings
 from datetime import timedelta
-from itertools import count
+from itertools import count, islice
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Union
 from weakref import proxy
@@ -61,6 +61,7 @@ from pytorch_lightning.trainer.optimizers import TrainerOptimizersMixin
 from pytorch_lightning.trainer.predict_loop import PredictLoop
 from pytorch_lightning.trainer.properties import TrainerProperties
 from pytorch_lightning.trainer.states import TrainerFn, TrainerState, TrainerStatus
+from pytorch_lightning.trainer.supporters import prefetch_iterator
 from pytorch_lightning.trainer.training_loop import TrainLoop
 from pytorch_lightning.trainer.training_tricks import TrainerTrainingTricksMixin
 from pytorch_lightning.tuner.lr_finder import _LRFinder
@@ -224,7 +225,8 @@ class Trainer(
 
             log_gpu_memory: None, 'min_max', 'all'. Might slow performance
 
-            log_every_n_steps: How often to log within steps (defaults to every 50 steps).
+            log_every_n_steps: How often to log within steps (defaults to every 50 steps). Also applies to the
+                evaluation step metrics, which are always logged on the last batch of each evaluation dataloader.
 
             prepare_data_per_node: If True, each LOCAL_RANK=0 will call prepare data.
                 Otherwise only NODE_RANK=0, LOCAL_RANK=0 will prepare data
@@ -891,15 +893,15 @@ class Trainer(
                     # run train epoch
                     self.train_loop.run_training_epoch()
 
-                if self.max_steps and self.max_steps <= self.global_step:
+                global_step = self.global_step
+                if self.max_steps and self.max_steps <= global_step:
                     self.train_loop.on_train_end()
                     return
 
                 # early stopping
-                met_min_epochs = (epoch >= self.min_epochs - 1) if self.min_epochs else True
-                met_min_steps = self.global_step >= self.min_steps if self.min_steps else True
-
                 if self.should_stop:
+                    met_min_epochs = (epoch >= self.min_epochs - 1) if self.min_epochs else True
+                    met_min_steps = global_step >= self.min_steps if self.min_steps else True
                     if met_min_epochs and met_min_steps:
                         self.train_loop.on_train_end()
                         return
@@ -962,41 +964,53 @@ class Trainer(
         # hook
         self.evaluation_loop.on_evaluation_epoch_start()
 
+        # bind the objects used on every batch to locals
+        evaluation_loop = self.evaluation_loop
+        profiler = self.profiler
+        logger_connector = self.logger_connector
+        # the batch outputs are only kept when the epoch end hook will receive them
+        track_outputs = evaluation_loop.should_track_batch_outputs_for_epoch_end
+
         # run validation/testing
         for dataloader_idx, dataloader in enumerate(dataloaders):
             # bookkeeping
             dl_outputs = []
             dataloader = self.accelerator.process_dataloader(dataloader)
-            dl_max_batches = self.evaluation_loop.max_batches[dataloader_idx]
+            dl_max_batches = evaluation_loop.max_batches[dataloader_idx]
 
-            for batch_idx, batch in enumerate(dataloader):
+            # stop short when running on limited batches
+            if dl_max_batches != float('inf'):
+                dataloader = islice(dataloader, int(dl_max_batches))
+
+            # read one batch ahead, as the training loop does, so that the last batch is known
+            for batch_idx, (batch, is_last_batch) in enumerate(prefetch_iterator(dataloader)):
                 if batch is None:
+                    # the previous step was the last one run, make sure its metrics are logged
+                    if is_last_batch:
+                        logger_connector.flush_eval_step_metrics()
                     continue
 
-                # stop short when running on limited batches
-                if batch_idx >= dl_max_batches:
-                    break
-
                 # hook
-                self.evaluation_loop.on_evaluation_batch_start(batch, batch_idx, dataloader_idx)
+                evaluation_loop.on_evaluation_batch_start(batch, batch_idx, dataloader_idx)
 
                 # lightning module methods
-                with self.profiler.profile("evaluation_step_and_end"):
-                    output = self.evaluation_loop.evaluation_step(batch, batch_idx, dataloader_idx)
-                    output = self.evaluation_loop.evaluation_step_end(output)
+                with profiler.profile("evaluation_step_and_end"):
+                    output = evaluation_loop.evaluation_step(batch, batch_idx, dataloader_idx)
+                    output = evaluation_loop.evaluation_step_end(output)
 
                 # hook + store predictions
-                self.evaluation_loop.on_evaluation_batch_end(output, batch, batch_idx, dataloader_idx)
+                evaluation_loop.on_evaluation_batch_end(output, batch, batch_idx, dataloader_idx)
 
                 # log batch metrics
-                self.logger_connector.update_eval_step_metrics()
+                logger_connector.update_eval_step_metrics(is_last_batch)
 
                 # track epoch level outputs
-                dl_outputs = self._track_output_for_epoch_end(dl_outputs, output)
+                if track_outputs:
+                    dl_outputs = self._track_output_for_epoch_end(dl_outputs, output)
 
             # store batch level output per dataloader
-            if self.evaluation_loop.should_track_batch_outputs_for_epoch_end:
-                self.evaluation_loop.outputs.append(dl_outputs)
+            if track_outputs:
+                evaluation_loop.outputs.append(dl_outputs)
 
         outputs = self.evaluation_loop.outputs
 
@@ -1236,6 +1250,21 @@ class Trainer(
 
         return output
 
+    def _is_hook_implemented(self, hook_name: str) -> bool:
+        """
+        Whether :meth:`call_hook` would reach an implementation of the hook in the LightningModule,
+        the accelerator or any of the callbacks. Used to skip dispatching hooks nobody implements.
+        """
+        if is_overridden(hook_name, self.lightning_module) or hasattr(self.accelerator, hook_name):
+            return True
+        base_hook = getattr(Callback, hook_name)
+        for callback in self.callbacks:
+            hook = getattr(callback, hook_name, None)
+            # compare bound methods by their function. `LambdaCallback` sets plain functions on the instance
+            if getattr(hook, '__func__', hook) is not base_hook:
+                return True
+        return False
+
     @staticmethod
     def _log_api_event(event: str) -> None:
         torch._C._log_api_usage_once("lightning.trainer." + event)
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from collections import OrderedDict
-from contextlib import contextmanager, suppress
+from contextlib import contextmanager
 from functools import partial, update_wrapper
 from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
@@ -54,6 +54,12 @@ class TrainLoop:
         self._skip_backward = False
         self._optimizer_freq_cumsum = None
         self._hiddens = None
+        # the train dataloader as processed by the accelerator, reused until the trainer's dataloader changes
+        self._processed_train_dataloader = None
+        self._processed_train_dataloader_source = None
+        # whether anything implements the per batch `on_batch_start` and `on_batch_end` hooks
+        self._call_on_batch_start = True
+        self._call_on_batch_end = True
 
         self.global_step = 0
         self.current_epoch = 0
@@ -101,14 +107,21 @@ class TrainLoop:
     def on_train_start(self):
         self.results.to(device=self.trainer.lightning_module.device)
 
+        # process the train dataloader again for every fit
+        self._processed_train_dataloader = None
+        self._processed_train_dataloader_source = None
+
+        # skip dispatching the per batch hooks when nothing implements them
+        self._call_on_batch_start = self.trainer._is_hook_implemented("on_batch_start")
+        self._call_on_batch_end = self.trainer._is_hook_implemented("on_batch_end")
+
         self.trainer.call_hook("on_train_start")
 
     def on_train_end(self):
         # trigger checkpoint check. need to temporarily decrease the global step to avoid saving duplicates
         # when a checkpoint was saved at the last step
-        self.global_step -= 1
-        self.check_checkpoint_callback(should_update=True, is_last=True)
-        self.global_step += 1
+        with self._decremented_global_step():
+            self.check_checkpoint_callback(should_update=True, is_last=True)
 
         # hook
         self.trainer.call_hook("on_train_end")
@@ -152,10 +165,11 @@ class TrainLoop:
         if epoch != 0 and self.trainer.reload_dataloaders_every_epoch:
             self.trainer.reset_train_dataloader(model)
 
-        # todo: specify the possible exception
-        with suppress(Exception):
-            # set seed for distributed sampler (enables shuffling for each epoch)
-            self.trainer.train_dataloader.sampler.set_epoch(epoch)
+        # set seed for distributed sampler (enables shuffling for each epoch)
+        sampler = getattr(self.trainer.train_dataloader, 'sampler', None)
+        set_epoch = getattr(sampler, 'set_epoch', None)
+        if callable(set_epoch):
+            set_epoch(epoch)
 
         # changing gradient according accumulation_scheduler
         self.trainer.accumulation_scheduler.on_train_epoch_start(self.trainer, self.trainer.lightning_module)
@@ -175,7 +189,8 @@ class TrainLoop:
 
         # hook
         self.trainer.call_hook('on_train_batch_end', processed_batch_end_outputs, batch, batch_idx, dataloader_idx)
-        self.trainer.call_hook('on_batch_end')
+        if self._call_on_batch_end:
+            self.trainer.call_hook('on_batch_end')
         self.trainer.logger_connector.on_batch_end()
 
         # figure out what to track for epoch end
@@ -440,13 +455,21 @@ class TrainLoop:
         return splits
 
     def run_training_epoch(self):
-        # modify dataloader if needed (ddp, etc...)
-        train_dataloader = self.trainer.accelerator.process_dataloader(self.trainer.train_dataloader)
+        # bind the objects used on every batch to locals
+        trainer = self.trainer
+        profiler = trainer.profiler
+        logger_connector = trainer.logger_connector
+
+        # modify dataloader if needed (ddp, etc...). only redone when the dataloader was reset since the last epoch
+        if trainer.train_dataloader is not self._processed_train_dataloader_source:
+            self._processed_train_dataloader = trainer.accelerator.process_dataloader(trainer.train_dataloader)
+            self._processed_train_dataloader_source = trainer.train_dataloader
 
         # track epoch output
         epoch_output = [[] for _ in range(self.num_active_optimizers)]
 
-        train_dataloader = self.trainer.data_connector.get_profiled_train_dataloader(train_dataloader)
+        # the profiled iterator is a generator, so it is created for every epoch
+        train_dataloader = trainer.data_connector.get_profiled_train_dataloader(self._processed_train_dataloader)
         dataloader_idx = 0
         batch_idx = None
 
@@ -456,7 +479,7 @@ class TrainLoop:
             # ------------------------------------
             # TRAINING_STEP + TRAINING_STEP_END
             # ------------------------------------
-            with self.trainer.profiler.profile("run_training_batch"):
+            with profiler.profile("run_training_batch"):
                 batch_output = self.run_training_batch(batch, batch_idx, dataloader_idx)
 
             # when returning -1 from train_step, we end epoch early
@@ -475,16 +498,16 @@ class TrainLoop:
             # -----------------------------------------
             # SAVE METRICS TO LOGGERS AND PROGRESS_BAR
             # -----------------------------------------
-            self.trainer.logger_connector.update_train_step_metrics()
+            logger_connector.update_train_step_metrics()
 
             # -----------------------------------------
             # VALIDATE IF NEEDED
             # -----------------------------------------
             should_check_val = self._should_check_val_fx(batch_idx, is_last_batch)
             if should_check_val:
-                self.trainer.validating = True
-                self.trainer._run_evaluation()
-                self.trainer.training = True
+                trainer.validating = True
+                trainer._run_evaluation()
+                trainer.training = True
 
             # -----------------------------------------
             # SAVE LOGGERS (ie: Tensorboard, etc...)
@@ -493,7 +516,7 @@ class TrainLoop:
 
             # update LR schedulers
             self.update_lr_schedulers('step')
-            self.trainer.checkpoint_connector.has_trained = True
+            trainer.checkpoint_connector.has_trained = True
 
             self.total_batch_idx += 1
 
@@ -501,7 +524,7 @@ class TrainLoop:
             self.increment_accumulated_grad_global_step()
 
             max_steps_reached = (self.max_steps is not None and self.max_steps <= self.global_step)
-            if max_steps_reached or self.trainer.should_stop or self._num_training_batches_reached(is_last_batch):
+            if max_steps_reached or trainer.should_stop or self._num_training_batches_reached(is_last_batch):
                 break
 
         if batch_idx is None:
@@ -515,20 +538,18 @@ class TrainLoop:
         # as they expect that the same step is used when logging epoch end metrics even when the batch loop has
         # finished. this means the attribute does not exactly track the number of optimizer steps applied.
         # TODO(@carmocca): deprecate and rename so users don't get confused
-        self.global_step -= 1
-        # log epoch metrics
-        self.trainer.logger_connector.update_train_epoch_metrics()
-        self.global_step += 1
+        with self._decremented_global_step():
+            # log epoch metrics
+            logger_connector.update_train_epoch_metrics()
 
         self.update_lr_schedulers('epoch')
 
-        did_train_only = self.trainer.disable_validation or self.trainer.evaluation_loop.should_skip_evaluation(
-            self.trainer.num_val_batches
+        did_train_only = trainer.disable_validation or trainer.evaluation_loop.should_skip_evaluation(
+            trainer.num_val_batches
         )
         if did_train_only:
-            self.global_step -= 1
-            self.check_checkpoint_callback(True)
-            self.global_step += 1
+            with self._decremented_global_step():
+                self.check_checkpoint_callback(True)
 
     def on_train_epoch_end(self, epoch_output: List[List[List['ResultCollection']]]) -> None:
         # inform logger the batch loop has finished
@@ -612,9 +633,10 @@ class TrainLoop:
 
         # hook
         self.trainer.logger_connector.on_batch_start()
-        response = self.trainer.call_hook("on_batch_start")
-        if response == -1:
-            return AttributeDict(signal=-1)
+        if self._call_on_batch_start:
+            response = self.trainer.call_hook("on_batch_start")
+            if response == -1:
+                return AttributeDict(signal=-1)
 
         # hook
         response = self.trainer.call_hook("on_train_batch_start", batch, batch_idx, dataloader_idx)
@@ -731,6 +753,18 @@ class TrainLoop:
         else:
             yield None
 
+    @contextmanager
+    def _decremented_global_step(self):
+        """
+        Temporarily decreases the global step by one, so that epoch end logging and checkpointing
+        see the step of the last optimizer step taken.
+        """
+        self.global_step -= 1
+        try:
+            yield None
+        finally:
+            self.global_step += 1
+
     def _process_closure_result(self, opt_closure_result: Optional[AttributeDict]) -> None:
         if not opt_closure_result:
             return
@@ -811,11 +845,8 @@ class TrainLoop:
         )
 
     def increment_accumulated_grad_global_step(self):
-        num_accumulated_batches_reached = self._accumulated_batches_reached()
-        num_training_batches_reached = self._num_training_batches_reached()
-
         # progress global step according to grads progress
-        if num_accumulated_batches_reached or num_training_batches_reached:
+        if self._accumulated_batches_reached() or self._num_training_batches_reached():
             self.global_step = self.trainer.accelerator.update_global_step(self.total_batch_idx, self.global_step)
 
     def _accumulated_batches_reached(self):
@@ -582,8 +582,9 @@ def test_validation_step_log_with_tensorboard(mock_log_metrics, tmpdir):
     # Train the model ⚡
     trainer.fit(model)
 
-    # hp_metric + 2 steps + epoch + 2 steps + epoch
-    expected_num_calls = 1 + 2 + 1 + 2 + 1
+    # hp_metric + last step + epoch + last step + epoch. the first step of each epoch is not logged
+    # as it is neither a multiple of `log_every_n_steps` nor the last batch
+    expected_num_calls = 1 + 1 + 1 + 1 + 1
 
     assert len(mock_log_metrics.mock_calls) == expected_num_calls
     assert mock_log_metrics.mock_calls[0] == call({'hp_metric': -1}, 0)
@@ -597,25 +598,18 @@ def test_validation_step_log_with_tensorboard(mock_log_metrics, tmpdir):
 
     expected = {'valid_loss_0_step', 'valid_loss_2'}
     assert set(get_metrics_at_idx(1)) == expected
-    assert set(get_metrics_at_idx(2)) == expected
+    assert get_metrics_at_idx(1)["valid_loss_0_step"] == model.val_losses[3]
 
-    assert get_metrics_at_idx(1)["valid_loss_0_step"] == model.val_losses[2]
-    assert get_metrics_at_idx(2)["valid_loss_0_step"] == model.val_losses[3]
+    assert set(get_metrics_at_idx(2)) == {'valid_loss_0_epoch', 'valid_loss_1', 'epoch'}
 
-    assert set(get_metrics_at_idx(3)) == {'valid_loss_0_epoch', 'valid_loss_1', 'epoch'}
+    assert get_metrics_at_idx(2)["valid_loss_1"] == torch.stack(model.val_losses[2:4]).mean()
 
-    assert get_metrics_at_idx(3)["valid_loss_1"] == torch.stack(model.val_losses[2:4]).mean()
+    assert set(get_metrics_at_idx(3)) == expected
+    assert get_metrics_at_idx(3)["valid_loss_0_step"] == model.val_losses[5]
 
-    expected = {'valid_loss_0_step', 'valid_loss_2'}
-    assert set(get_metrics_at_idx(4)) == expected
-    assert set(get_metrics_at_idx(5)) == expected
-
-    assert get_metrics_at_idx(4)["valid_loss_0_step"] == model.val_losses[4]
-    assert get_metrics_at_idx(5)["valid_loss_0_step"] == model.val_losses[5]
+    assert set(get_metrics_at_idx(4)) == {'valid_loss_0_epoch', 'valid_loss_1', 'epoch'}
 
-    assert set(get_metrics_at_idx(6)) == {'valid_loss_0_epoch', 'valid_loss_1', 'epoch'}
-
-    assert get_metrics_at_idx(6)["valid_loss_1"] == torch.stack(model.val_losses[4:]).mean()
+    assert get_metrics_at_idx(4)["valid_loss_1"] == torch.stack(model.val_losses[4:]).mean()
 
     results = trainer.test(model)
     assert set(trainer.callback_metrics) == {
@@ -626,3 +620,52 @@ def test_validation_step_log_with_tensorboard(mock_log_metrics, tmpdir):
         'test_loss',
     }
     assert set(results[0]) == {'test_loss'}
+
+
+@pytest.mark.parametrize(['num_batches', 'last_batch_none', 'log_interval', 'expected_steps'], [
+    (5, False, 2, [1, 3, 4]),
+    (5, True, 3, [2, 3]),
+])
+@mock.patch("pytorch_lightning.trainer.connectors.logger_connector.logger_connector.LoggerConnector.log_metrics")
+def test_eval_step_logging_every_n_steps(
+    mock_log_metrics, tmpdir, num_batches, last_batch_none, log_interval, expected_steps
+):
+    """
+    Tests that the evaluation step metrics are logged every `log_every_n_steps` and on the last batch,
+    also when the last batch is skipped because the dataloader yielded `None`
+    """
+
+    def collate(samples):
+        if last_batch_none and samples[0] is None:
+            return None
+        return torch.utils.data.dataloader.default_collate(samples)
+
+    class NoneAtEndDataset(RandomDataset):
+
+        def __getitem__(self, index):
+            if last_batch_none and index == len(self) - 1:
+                return None
+            return super().__getitem__(index)
+
+    class TestModel(BoringModel):
+
+        def validation_step(self, batch, batch_idx):
+            out = super().validation_step(batch, batch_idx)
+            self.log('x', out['x'], on_step=True, on_epoch=False)
+            return out
+
+        def val_dataloader(self):
+            return torch.utils.data.DataLoader(NoneAtEndDataset(32, num_batches), collate_fn=collate)
+
+    model = TestModel()
+    model.validation_epoch_end = None
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        log_every_n_steps=log_interval,
+        weights_summary=None,
+    )
+    trainer.validate(model)
+
+    steps = [c[1]['step'] for c in mock_log_metrics.call_args_list if 'step' in c[1]]
+    assert steps == expected_steps
@@ -17,6 +17,7 @@ import torch
 from torch.utils.data import DataLoader
 
 from pytorch_lightning import Trainer
+from pytorch_lightning.callbacks import LambdaCallback
 from tests.helpers.boring_model import BoringModel, RandomDataset
 from tests.helpers.runif import RunIf
 
@@ -71,6 +72,66 @@ def test_log_epoch_metrics_before_on_evaluation_end(update_eval_epoch_metrics_mo
     assert order == ["log_epoch_metrics", "on_validation_end"]
 
 
+@mock.patch("pytorch_lightning.trainer.trainer.Trainer._track_output_for_epoch_end")
+def test_outputs_not_tracked_without_epoch_end(track_output_mock, tmpdir):
+    """Test that the batch outputs are only tracked when `validation_epoch_end` is overridden"""
+    track_output_mock.side_effect = lambda outputs, output: outputs + [output]
+
+    model = BoringModel()
+    model.validation_epoch_end = None
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        limit_train_batches=1,
+        limit_val_batches=2,
+        max_epochs=1,
+        num_sanity_val_steps=0,
+        weights_summary=None,
+    )
+    trainer.fit(model)
+    assert not track_output_mock.called
+
+    trainer.validate(BoringModel())
+    assert track_output_mock.call_count == 2
+
+
+def test_evaluation_loop_fetches_only_limited_batches(tmpdir):
+    """Test that the evaluation loop does not fetch batches past `limit_val_batches`"""
+    fetched = []
+
+    class CountingDataset(RandomDataset):
+
+        def __getitem__(self, index):
+            fetched.append(index)
+            return super().__getitem__(index)
+
+    class TestModel(BoringModel):
+
+        def val_dataloader(self):
+            return DataLoader(CountingDataset(32, 64))
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        limit_val_batches=3,
+        weights_summary=None,
+    )
+    trainer.validate(TestModel())
+    assert fetched == [0, 1, 2]
+
+
+def test_batch_hooks_only_called_when_implemented(tmpdir):
+    """Test that the evaluation loop skips the batch hooks nobody implements"""
+    batch_indices = []
+    callback = LambdaCallback(on_validation_batch_start=lambda *args: batch_indices.append(args[3]))
+    trainer = Trainer(default_root_dir=tmpdir, limit_val_batches=2, callbacks=[callback], progress_bar_refresh_rate=0)
+    with mock.patch.object(trainer, "call_hook", wraps=trainer.call_hook) as call_hook_mock:
+        trainer.validate(BoringModel())
+    hook_names = [c[0][0] for c in call_hook_mock.call_args_list]
+    assert hook_names.count("on_validation_batch_start") == 2
+    assert "on_validation_batch_end" not in hook_names
+    assert batch_indices == [0, 1]
+
+
 @RunIf(min_gpus=1)
 def test_memory_consumption_validation(tmpdir):
     """Test that the training batch is no longer in GPU memory when running validation"""
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
+from unittest import mock
 
 import pytest
 import torch
 
 from pytorch_lightning import seed_everything, Trainer
+from pytorch_lightning.callbacks import LambdaCallback
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers import BoringModel
 
@@ -185,3 +187,22 @@ def test_warning_valid_train_step_end(tmpdir):
     trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=1)
 
     trainer.fit(model)
+
+
+def test_batch_hooks_only_called_when_implemented(tmpdir):
+    """Test that the training loop skips `on_batch_start` and `on_batch_end` when nobody implements them"""
+    on_batch_end = mock.Mock()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        max_epochs=1,
+        callbacks=[LambdaCallback(on_batch_end=on_batch_end)],
+        progress_bar_refresh_rate=0,
+    )
+    with mock.patch.object(trainer, "call_hook", wraps=trainer.call_hook) as call_hook_mock:
+        trainer.fit(BoringModel())
+    hook_names = [c[0][0] for c in call_hook_mock.call_args_list]
+    assert hook_names.count("on_batch_end") == 2
+    assert "on_batch_start" not in hook_names
+    assert on_batch_end.call_count == 2
@@ -1684,3 +1684,52 @@ def test_request_dataloader(tmpdir):
     assert model.on_train_batch_start_called
     assert model.on_val_dataloader_called
     assert model.on_val_batch_start_called
+
+
+def test_train_sampler_set_epoch(tmpdir):
+    """Test that `set_epoch` is called on the train sampler at the start of every epoch"""
+
+    class EpochSampler(SequentialSampler):
+
+        def __init__(self, data_source):
+            super().__init__(data_source)
+            self.epochs = []
+
+        def set_epoch(self, epoch):
+            self.epochs.append(epoch)
+
+    dataset = RandomDataset(32, 64)
+    sampler = EpochSampler(dataset)
+
+    class TestModel(BoringModel):
+
+        def train_dataloader(self):
+            return DataLoader(dataset, sampler=sampler)
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        max_epochs=3,
+        weights_summary=None,
+    )
+    trainer.fit(TestModel())
+    assert sampler.epochs == [0, 1, 2]
+
+
+@pytest.mark.parametrize(["reload_dataloaders_every_epoch", "expected_calls"], [(False, 1), (True, 3)])
+def test_train_dataloader_processed_once_per_reset(tmpdir, reload_dataloaders_every_epoch, expected_calls):
+    """Test that the train dataloader is only processed by the accelerator again after it was reset"""
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        max_epochs=3,
+        reload_dataloaders_every_epoch=reload_dataloaders_every_epoch,
+        weights_summary=None,
+    )
+    accelerator = trainer.accelerator
+    with patch.object(accelerator, "process_dataloader", wraps=accelerator.process_dataloader) as process_mock:
+        trainer.fit(BoringModel())
+    assert process_mock.call_count == expected_calls
+    assert trainer.global_step == 6
@@ -19,7 +19,7 @@ import sys
 from argparse import Namespace
 from copy import deepcopy
 from pathlib import Path
-from unittest.mock import ANY, call, patch
+from unittest.mock import ANY, call, MagicMock, patch
 
 import cloudpickle
 import pytest
@@ -30,7 +30,7 @@ from torch.utils.data import DataLoader
 
 import tests.helpers.utils as tutils
 from pytorch_lightning import Callback, LightningDataModule, LightningModule, Trainer
-from pytorch_lightning.callbacks import EarlyStopping, ModelCheckpoint
+from pytorch_lightning.callbacks import EarlyStopping, LambdaCallback, ModelCheckpoint
 from pytorch_lightning.callbacks.prediction_writer import BasePredictionWriter
 from pytorch_lightning.core.saving import load_hparams_from_tags_csv, load_hparams_from_yaml, save_hparams_to_tags_csv
 from pytorch_lightning.loggers import TensorBoardLogger
@@ -1938,3 +1938,38 @@ def test_exception_when_lightning_module_is_not_set_on_trainer():
         trainer.test()
     with pytest.raises(MisconfigurationException, match=r"`model` must be provided.*predict"):
         trainer.predict()
+
+
+@pytest.mark.parametrize(
+    "hook_name", ["on_batch_start", "on_batch_end", "on_validation_batch_start", "on_test_batch_end"]
+)
+def test_is_hook_implemented(tmpdir, hook_name):
+    """Test that the trainer detects hook implementations in each kind of callback"""
+
+    def is_hook_implemented(callbacks=None):
+        trainer = Trainer(default_root_dir=tmpdir, callbacks=callbacks, progress_bar_refresh_rate=0)
+        trainer.model = BoringModel()
+        return trainer._is_hook_implemented(hook_name)
+
+    def hook(*_):
+        pass
+
+    assert not is_hook_implemented()
+    assert not is_hook_implemented(callbacks=[Callback(), LambdaCallback()])
+    assert is_hook_implemented(callbacks=[type("HookedCallback", (Callback, ), {hook_name: hook})()])
+    assert is_hook_implemented(callbacks=[LambdaCallback(**{hook_name: hook})])
+    assert is_hook_implemented(callbacks=[MagicMock()])
+
+
+def test_is_hook_implemented_in_model(tmpdir):
+    """Test that the trainer detects a hook overridden in the LightningModule"""
+
+    class HookedModel(BoringModel):
+
+        def on_validation_batch_start(self, batch, batch_idx, dataloader_idx):
+            pass
+
+    trainer = Trainer(default_root_dir=tmpdir, progress_bar_refresh_rate=0)
+    trainer.model = HookedModel()
+    assert trainer._is_hook_implemented("on_validation_batch_start")
+    assert not trainer._is_hook_implemented("on_validation_batch_end")